@@ -1,7 +1,6 @@
 import json
 from typing import Dict, Any
 import os
-from openai import OpenAI
 
 from ..prompts.system_prompt import get_system_prompt
 
@@ -9,8 +8,15 @@ class BrainService:
     """Service for LLM-powered decision engine to convert voice commands to actions."""
 
     def __init__(self):
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.model = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
+        self.system_prompt = get_system_prompt()
+
+    def warm_up(self) -> None:
+        """Open the connection to the LLM provider ahead of the first command."""
+        self.client.models.retrieve(self.model)
 
     def decide_action(self, transcript: str, dom_context: str) -> Dict[str, Any]:
         """
@@ -37,7 +43,7 @@ Based on the user's command and the current page structure, generate the appropr
                 messages=[
                     {
                         "role": "system",
-                        "content": get_system_prompt()
+                        "content": self.system_prompt
                     },
                     {
                         "role": "user",
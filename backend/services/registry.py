@@ -0,0 +1,100 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class ServiceRegistry:
+    """Registry that builds provider services on first use and prewarms them on request."""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._warm_status: Dict[str, str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self.prewarm_complete = False
+        self.prewarm_ok = False
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """
+        Register a factory for a service.
+
+        Args:
+            name: Name the service is looked up by
+            factory: Zero-argument callable that imports and builds the service
+        """
+        self._factories[name] = factory
+        self._locks[name] = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        """
+        Return the service instance, building it on first use.
+
+        Args:
+            name: Registered service name
+
+        Returns:
+            The shared service instance
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        if name not in self._factories:
+            raise KeyError(f"Unknown service: {name}")
+
+        # One lock per service, so a slow build only blocks callers of that service
+        with self._locks[name]:
+            if name not in self._instances:
+                self._instances[name] = self._factories[name]()
+            return self._instances[name]
+
+    def prewarm(self, names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Build services and open their provider connections ahead of the first request.
+
+        Failures are recorded rather than raised so one unreachable provider
+        does not stop the others from warming.
+
+        Args:
+            names: Services to prewarm (defaults to every registered service)
+
+        Returns:
+            Dictionary mapping service name to "warm" or an error message
+        """
+        names = list(names) if names is not None else list(self._factories)
+        for name in names:
+            try:
+                service = self.get(name)
+                warm_up = getattr(service, "warm_up", None)
+                if warm_up is not None:
+                    warm_up()
+                self._warm_status[name] = "warm"
+            except Exception as e:
+                print(f"Failed to prewarm {name}: {str(e)}")
+                self._warm_status[name] = f"error: {str(e)}"
+
+        self.prewarm_ok = all(self._warm_status.get(name) == "warm" for name in names)
+        self.prewarm_complete = True
+        return dict(self._warm_status)
+
+    def check_names(self, names: Iterable[str]) -> None:
+        """
+        Ensure every name refers to a registered service.
+
+        Args:
+            names: Service names to check
+
+        Raises:
+            ValueError: If any name is not registered
+        """
+        unknown = [name for name in names if name not in self._factories]
+        if unknown:
+            raise ValueError(f"Unknown services: {', '.join(unknown)}")
+
+    def status(self) -> Dict[str, str]:
+        """Return the state of every registered or prewarmed service."""
+        status = {
+            name: "loaded" if name in self._instances else "not loaded"
+            for name in self._factories
+        }
+        status.update(self._warm_status)
+        return status
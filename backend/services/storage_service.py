@@ -1,12 +1,12 @@
-import boto3
 import os
-from botocore.exceptions import ClientError
 from typing import Optional
 
 class StorageService:
     """Service for handling Vultr Object Storage uploads and downloads."""
 
     def __init__(self):
+        import boto3
+
         self.bucket_name = os.getenv("VULTR_BUCKET_NAME", "voice-samurai-logs")
 
         self.s3_client = boto3.client(
@@ -17,6 +17,10 @@ class StorageService:
             region_name=os.getenv("VULTR_REGION", "ewr")
         )
 
+    def warm_up(self) -> None:
+        """Open the connection to Vultr Object Storage ahead of the first upload."""
+        self.s3_client.head_bucket(Bucket=self.bucket_name)
+
     def upload_file(self, file_bytes: bytes, filename: str, bucket: Optional[str] = None) -> str:
         """
         Upload file to Vultr Object Storage and return public URL.
@@ -44,7 +48,7 @@ class StorageService:
 
             return public_url
 
-        except ClientError as e:
+        except self.s3_client.exceptions.ClientError as e:
             raise Exception(f"Failed to upload file to Vultr: {str(e)}")
 
     def download_file(self, filename: str, bucket: Optional[str] = None) -> bytes:
@@ -68,5 +72,5 @@ class StorageService:
 
             return response['Body'].read()
 
-        except ClientError as e:
+        except self.s3_client.exceptions.ClientError as e:
             raise Exception(f"Failed to download file from Vultr: {str(e)}")
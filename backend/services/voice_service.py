@@ -11,6 +11,19 @@ class VoiceService:
         self.base_url = "https://api.elevenlabs.io/v1"
         self.voice_id = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
 
+        # Shared session so provider connections are reused across requests
+        self.session = requests.Session()
+
+    def warm_up(self) -> None:
+        """Open the connections to ElevenLabs and OpenAI ahead of the first command."""
+        response = self.session.get(
+            f"{self.base_url}/voices/{self.voice_id}",
+            headers={"xi-api-key": self.api_key},
+            timeout=10
+        )
+        response.raise_for_status()
+        self.session.head("https://api.openai.com/v1/models", timeout=10)
+
     def transcribe_audio(self, audio_bytes: bytes) -> str:
         """
         Transcribe audio to text using ElevenLabs STT.
@@ -31,7 +44,7 @@ class VoiceService:
                 "audio": ("audio.wav", audio_bytes, "audio/wav")
             }
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/speech-to-text",
                 headers=headers,
                 files=files,
@@ -59,7 +72,7 @@ class VoiceService:
                 "model": (None, "whisper-1")
             }
 
-            response = requests.post(
+            response = self.session.post(
                 "https://api.openai.com/v1/audio/transcriptions",
                 headers=headers,
                 files=files,
@@ -99,7 +112,7 @@ class VoiceService:
                 }
             }
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/text-to-speech/{self.voice_id}",
                 json=payload,
                 headers=headers,
@@ -0,0 +1,42 @@
+// Voice Samurai Audio Store
+// IndexedDB-backed Blob handoff between the popup and the service worker,
+// since runtime messages cannot carry Blobs
+
+const AUDIO_DB_NAME = "voice-samurai"
+const AUDIO_STORE_NAME = "audio"
+
+function openAudioDB() {
+    return new Promise((resolve, reject) => {
+        const request = indexedDB.open(AUDIO_DB_NAME, 1)
+        request.onupgradeneeded = () => request.result.createObjectStore(AUDIO_STORE_NAME)
+        request.onsuccess = () => resolve(request.result)
+        request.onerror = () => reject(request.error)
+    })
+}
+
+// Run a single request against the audio store and resolve with its result
+async function withAudioStore(mode, operation) {
+    const db = await openAudioDB()
+    try {
+        return await new Promise((resolve, reject) => {
+            const transaction = db.transaction(AUDIO_STORE_NAME, mode)
+            const request = operation(transaction.objectStore(AUDIO_STORE_NAME))
+            transaction.oncomplete = () => resolve(request.result)
+            transaction.onerror = () => reject(transaction.error)
+        })
+    } finally {
+        db.close()
+    }
+}
+
+// Store a Blob under a key
+function putAudio(key, blob) {
+    return withAudioStore("readwrite", (store) => store.put(blob, key))
+}
+
+// Read and remove the Blob stored under a key (undefined if missing)
+async function takeAudio(key) {
+    const blob = await withAudioStore("readonly", (store) => store.get(key))
+    await withAudioStore("readwrite", (store) => store.delete(key))
+    return blob
+}
@@ -1,3 +1,11 @@
+importScripts("audio_store.js")
+
+const BACKEND_URL = "http://localhost:8000/api/v1/voice/command"
+
+// How the backend returns speech: "binary" (multipart result + raw audio),
+// "url" (public object-storage URL) or "base64"
+const RESPONSE_MODE = "binary"
+
 const recordingState = {
     isRecording: false,
     tabId: null,
@@ -43,22 +51,19 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
 // Send audio + DOM to backend
 async function handleBackendRequest(request, sendResponse) {
     try {
-        const { audio, dom, tabId } = request
+        const { audioKey, dom, tabId } = request
 
-        // Create FormData
-        const formData = new FormData()
-
-        // Convert base64 audio to Blob
-        const byteCharacters = atob(audio)
-        const byteNumbers = new Array(byteCharacters.length)
-        for (let i = 0; i < byteCharacters.length; i++) {
-            byteNumbers[i] = byteCharacters.charCodeAt(i)
+        // The popup stored the recording Blob in IndexedDB
+        const audioBlob = await takeAudio(audioKey)
+        if (!audioBlob) {
+            throw new Error("Recording not found")
         }
-        const byteArray = new Uint8Array(byteNumbers)
-        const audioBlob = new Blob([byteArray], { type: "audio/webm" })
 
+        // Create FormData, the Blob uploaded as-is
+        const formData = new FormData()
         formData.append("audio", audioBlob, "recording.webm")
         formData.append("dom_context", JSON.stringify(dom))
+        formData.append("response_mode", RESPONSE_MODE)
 
         console.log("[v0] Sending to backend:", {
             audioSize: audioBlob.size,
@@ -66,7 +71,7 @@ async function handleBackendRequest(request, sendResponse) {
         })
 
         // Send to backend
-        const response = await fetch("http://localhost:8000/api/v1/voice/command", {
+        const response = await fetch(BACKEND_URL, {
             method: "POST",
             body: formData,
         })
@@ -75,7 +80,18 @@ async function handleBackendRequest(request, sendResponse) {
             throw new Error(`Backend error: ${response.status}`)
         }
 
-        const result = await response.json()
+        // Binary mode: a multipart body with the JSON result and the raw speech audio
+        let result
+        let audioResponseKey = null
+        if (RESPONSE_MODE === "binary") {
+            const parts = await response.formData()
+            result = JSON.parse(parts.get("result"))
+            // A single fixed key, so audio the popup never collects is overwritten
+            audioResponseKey = "latest-response"
+            await putAudio(audioResponseKey, parts.get("audio"))
+        } else {
+            result = await response.json()
+        }
 
         console.log("[v0] Backend response:", result)
 
@@ -95,6 +111,8 @@ async function handleBackendRequest(request, sendResponse) {
             thought: result.thought,
             speakBefore: result.speak_before,
             actions: result.actions,
+            audioResponseKey: audioResponseKey,
+            audioResponseUrl: result.audio_response_url,
             audioResponse: result.audio_response_base64,
             audioLogUrl: result.audio_log_url,
         })
@@ -9,58 +9,245 @@ const audioChunks = []
 // Declare chrome variable
 const chrome = window.chrome
 
+// Target interactive elements
+const INTERACTIVE_SELECTOR = [
+    "a",
+    "button",
+    "input",
+    "select",
+    "textarea",
+    '[role="button"]',
+    '[role="link"]',
+    "[onclick]",
+].join(",")
+
+// How far outside the viewport an element still counts as "near"
+const NEAR_VIEWPORT_MARGIN = "100% 0px 100% 0px"
+const MAX_TEXT_LENGTH = 100
+
+// Persistent element index: data-v-id -> element, element -> cached entry
+const elementIndex = new Map()
+const elementEntries = new WeakMap()
+let nextElementId = 0
+let indexReady = false
+let intersectionObserver = null
+let mutationObserver = null
+
+// Read up to MAX_TEXT_LENGTH characters of text without walking the whole subtree
+function getShortText(el) {
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT)
+    let text = ""
+    while (walker.nextNode() && text.length < MAX_TEXT_LENGTH) {
+        const chunk = walker.currentNode.nodeValue.trim()
+        if (chunk) text += (text ? " " : "") + chunk
+    }
+    return text.substring(0, MAX_TEXT_LENGTH)
+}
+
+// Cheap accessible name: explicit labels first, text content last
+function getAccessibleName(el) {
+    const ariaLabel = el.getAttribute("aria-label")
+    if (ariaLabel) return ariaLabel.trim().substring(0, MAX_TEXT_LENGTH)
+
+    const labelledBy = el.getAttribute("aria-labelledby")
+    if (labelledBy) {
+        const names = labelledBy
+            .split(/\s+/)
+            .map((labelId) => document.getElementById(labelId))
+            .filter(Boolean)
+            .map((labelEl) => getShortText(labelEl))
+            .join(" ")
+        if (names) return names.substring(0, MAX_TEXT_LENGTH)
+    }
+
+    if (el.labels && el.labels.length > 0) {
+        const labelText = getShortText(el.labels[0])
+        if (labelText) return labelText
+    }
+
+    const title = el.getAttribute("title") || el.getAttribute("alt")
+    if (title) return title.trim().substring(0, MAX_TEXT_LENGTH)
+
+    if (el.tagName === "INPUT" && (el.type === "submit" || el.type === "button")) {
+        return (el.value || "").substring(0, MAX_TEXT_LENGTH)
+    }
+
+    return getShortText(el)
+}
+
+// Build the static (layout-free) part of an element's description
+function describeElement(el, vId) {
+    return {
+        id: vId,
+        tag: el.tagName.toLowerCase(),
+        text: getAccessibleName(el),
+        placeholder: el.placeholder || "",
+        type: el.type || "",
+        ariaLabel: el.getAttribute("aria-label") || "",
+    }
+}
+
+// Names taken from labels or the value property live outside what the
+// MutationObserver invalidates, so they are re-read on every capture
+function hasExternalName(el) {
+    return (
+        el.hasAttribute("aria-labelledby") ||
+        (el.labels && el.labels.length > 0) ||
+        (el.tagName === "INPUT" && (el.type === "submit" || el.type === "button"))
+    )
+}
+
+function indexElement(el) {
+    if (elementEntries.has(el)) return
+
+    // Keep an existing id so references stay stable across commands
+    let vId = el.getAttribute("data-v-id")
+    if (!vId || elementIndex.has(vId)) {
+        // Skip ids already taken by elements that kept theirs
+        do {
+            vId = `v-${nextElementId}`
+            nextElementId++
+        } while (elementIndex.has(vId))
+        el.setAttribute("data-v-id", vId)
+    }
+
+    elementIndex.set(vId, el)
+    elementEntries.set(el, { id: vId, info: null, nearViewport: null })
+    intersectionObserver.observe(el)
+}
+
+function unindexElement(el) {
+    const entry = elementEntries.get(el)
+    if (!entry) return
+
+    elementIndex.delete(entry.id)
+    elementEntries.delete(el)
+    intersectionObserver.unobserve(el)
+}
+
+// Index a node and any interactive descendants it brought along
+function indexSubtree(node) {
+    if (node.nodeType !== Node.ELEMENT_NODE) return
+    if (node.matches(INTERACTIVE_SELECTOR)) indexElement(node)
+    node.querySelectorAll(INTERACTIVE_SELECTOR).forEach(indexElement)
+}
+
+function unindexSubtree(node) {
+    if (node.nodeType !== Node.ELEMENT_NODE) return
+    unindexElement(node)
+    node.querySelectorAll("[data-v-id]").forEach(unindexElement)
+}
+
+// Drop the cached description of the indexed element that contains a node
+function invalidateContaining(node) {
+    const el = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement
+    const owner = el?.closest(INTERACTIVE_SELECTOR)
+    const entry = owner && elementEntries.get(owner)
+    if (entry) entry.info = null
+}
+
+function handleIntersections(entries) {
+    entries.forEach((change) => {
+        const entry = elementEntries.get(change.target)
+        if (!entry) return
+        entry.nearViewport = change.isIntersecting
+    })
+}
+
+function handleMutations(mutations) {
+    mutations.forEach((mutation) => {
+        if (mutation.type === "childList") {
+            mutation.removedNodes.forEach((node) => {
+                if (!node.isConnected) unindexSubtree(node)
+            })
+            mutation.addedNodes.forEach(indexSubtree)
+            invalidateContaining(mutation.target)
+        } else if (mutation.type === "attributes") {
+            const el = mutation.target
+            if (el.matches(INTERACTIVE_SELECTOR)) {
+                indexElement(el)
+                invalidateContaining(el)
+            } else {
+                unindexElement(el)
+            }
+        } else {
+            invalidateContaining(mutation.target)
+        }
+    })
+}
+
+// Scan the page on the first capture, then keep the index current from
+// observer callbacks; pages that are never commanded are left untouched
+function initElementIndex() {
+    if (indexReady || !document.documentElement) return
+
+    intersectionObserver = new IntersectionObserver(handleIntersections, {
+        rootMargin: NEAR_VIEWPORT_MARGIN,
+    })
+    mutationObserver = new MutationObserver(handleMutations)
+
+    indexSubtree(document.documentElement)
+
+    mutationObserver.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        characterData: true,
+        attributes: true,
+        attributeFilter: ["aria-label", "aria-labelledby", "placeholder", "type", "role", "onclick", "title", "value"],
+    })
+    indexReady = true
+}
+
+function isInViewport(rect) {
+    return rect.bottom > 0 && rect.top < window.innerHeight && rect.right > 0 && rect.left < window.innerWidth
+}
+
 // Get simplified DOM for LLM processing
-function getSimplifiedDOM() {
-    const elements = []
-    const elementMap = new Map()
-    let id = 0
+// scope: "all" (default), "near" (within one screen of the viewport) or "viewport"
+function getSimplifiedDOM(scope = "all") {
+    initElementIndex()
 
-    // Target interactive elements
-    const selectors = ["a", "button", "input", "select", "textarea", '[role="button"]', '[role="link"]', "[onclick]"]
-    const nodeList = document.querySelectorAll(selectors.join(","))
+    const captured = []
 
-    nodeList.forEach((el) => {
+    elementIndex.forEach((el, vId) => {
         try {
-            // Check if element is visible
+            const entry = elementEntries.get(el)
+
+            // The IntersectionObserver only narrows down which elements to measure;
+            // elements it has not reported on yet are measured to be safe
+            if (scope !== "all" && entry.nearViewport === false) return
+
+            // Measure the emitted elements fresh; the reads share one layout pass
             const rect = el.getBoundingClientRect()
             if (rect.width <= 0 || rect.height <= 0) return
+            if (scope === "viewport" && !isInViewport(rect)) return
 
-            const vId = `v-${id}`
-            id++
-
-            // Assign unique identifier
-            el.setAttribute("data-v-id", vId)
-            elementMap.set(vId, el)
-
-            // Extract element info
-            const text = el.textContent?.trim().substring(0, 100) || ""
-            const placeholder = el.placeholder || ""
-            const type = el.type || ""
-            const tag = el.tagName.toLowerCase()
-
-            // Get aria labels if available
-            const ariaLabel = el.getAttribute("aria-label") || ""
-
-            const elementInfo = {
-                id: vId,
-                tag: tag,
-                text: text,
-                placeholder: placeholder,
-                type: type,
-                ariaLabel: ariaLabel,
-                x: Math.round(rect.left),
-                y: Math.round(rect.top),
-                width: Math.round(rect.width),
-                height: Math.round(rect.height),
-            }
+            if (!entry.info || hasExternalName(el)) entry.info = describeElement(el, vId)
 
-            elements.push(elementInfo)
+            captured.push({
+                el: el,
+                info: {
+                    ...entry.info,
+                    x: Math.round(rect.left),
+                    y: Math.round(rect.top),
+                    width: Math.round(rect.width),
+                    height: Math.round(rect.height),
+                },
+            })
         } catch (e) {
             console.error("[v0] Error processing element:", e)
         }
     })
 
-    return elements
+    // Index order is insertion order; send elements in document order
+    captured.sort((a, b) => (a.el.compareDocumentPosition(b.el) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1))
+
+    return captured.map((item) => item.info)
+}
+
+// Resolve a data-v-id from the index, falling back to a DOM query
+function findElement(vId) {
+    return elementIndex.get(vId) || document.querySelector(`[data-v-id="${vId}"]`)
 }
 
 // Execute action plan from backend
@@ -74,7 +261,7 @@ async function executeActions(actions) {
             switch (type) {
                 case "click":
                     if (target) {
-                        const element = document.querySelector(`[data-v-id="${target}"]`)
+                        const element = findElement(target)
                         if (element) {
                             element.scrollIntoView({ behavior: "smooth", block: "center" })
                             await new Promise((resolve) => setTimeout(resolve, 300))
@@ -86,7 +273,7 @@ async function executeActions(actions) {
 
                 case "fill":
                     if (target && value) {
-                        const element = document.querySelector(`[data-v-id="${target}"]`)
+                        const element = findElement(target)
                         if (element && (element.tagName === "INPUT" || element.tagName === "TEXTAREA")) {
                             element.scrollIntoView({ behavior: "smooth", block: "center" })
                             await new Promise((resolve) => setTimeout(resolve, 300))
@@ -116,7 +303,7 @@ async function executeActions(actions) {
 
                 case "hover":
                     if (target) {
-                        const element = document.querySelector(`[data-v-id="${target}"]`)
+                        const element = findElement(target)
                         if (element) {
                             const event = new MouseEvent("mouseover", { bubbles: true })
                             element.dispatchEvent(event)
@@ -141,7 +328,7 @@ async function executeActions(actions) {
 chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
     if (request.type === "GET_DOM") {
         try {
-            const dom = getSimplifiedDOM()
+            const dom = getSimplifiedDOM(request.scope)
             sendResponse({ success: true, dom: dom })
         } catch (e) {
             console.error("[v0] Error getting DOM:", e)
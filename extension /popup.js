@@ -3,6 +3,13 @@ let mediaRecorder = null
 let audioChunks = []
 let currentTabId = null
 
+// Low-bitrate Opus is plenty for speech and keeps uploads small
+const RECORDING_MIME_TYPE = "audio/webm;codecs=opus"
+const RECORDING_BITS_PER_SECOND = 24000
+
+// Which elements to capture: "all", "near" (one screen around the viewport) or "viewport"
+const DOM_SCOPE = "all"
+
 const recordBtn = document.getElementById("recordBtn")
 const stopBtn = document.getElementById("stopBtn")
 const resetBtn = document.getElementById("resetBtn")
@@ -34,7 +41,10 @@ recordBtn.addEventListener("click", async () => {
         const stream = await navigator.mediaDevices.getUserMedia({ audio: true })
 
         // Set up media recorder
-        mediaRecorder = new MediaRecorder(stream, { mimeType: "audio/webm" })
+        const recorderOptions = MediaRecorder.isTypeSupported(RECORDING_MIME_TYPE)
+            ? { mimeType: RECORDING_MIME_TYPE, audioBitsPerSecond: RECORDING_BITS_PER_SECOND }
+            : { mimeType: "audio/webm" }
+        mediaRecorder = new MediaRecorder(stream, recorderOptions)
         audioChunks = []
 
         mediaRecorder.addEventListener("dataavailable", (event) => {
@@ -73,77 +83,87 @@ stopBtn.addEventListener("click", () => {
     }
 })
 
+// Play the backend's speech response without decoding it in JS
+async function playAudioResponse(response) {
+    let audioUrl = null
+    if (response.audioResponseKey) {
+        const audioBlob = await takeAudio(response.audioResponseKey)
+        if (audioBlob) audioUrl = URL.createObjectURL(audioBlob)
+    } else if (response.audioResponseUrl) {
+        audioUrl = response.audioResponseUrl
+    } else if (response.audioResponse) {
+        audioUrl = `data:audio/mpeg;base64,${response.audioResponse}`
+    }
+
+    if (audioUrl) {
+        const audio = new Audio(audioUrl)
+        audio.play().catch((e) => console.error("[v0] Error playing audio:", e))
+    }
+}
+
 // Handle recording stop
 async function handleRecordingStop() {
     try {
         // Create audio blob
-        const audioBlob = new Blob(audioChunks, { type: "audio/webm" })
+        const audioBlob = new Blob(audioChunks, { type: mediaRecorder.mimeType || "audio/webm" })
 
-        // Convert to base64
-        const reader = new FileReader()
-        reader.onload = async (e) => {
-            const base64Audio = e.target.result.split(",")[1]
+        // Get DOM from active tab
+        const domResponse = await chrome.tabs.sendMessage(currentTabId, {
+            type: "GET_DOM",
+            scope: DOM_SCOPE,
+        })
 
-            // Get DOM from active tab
-            const domResponse = await chrome.tabs.sendMessage(currentTabId, {
-                type: "GET_DOM",
-            })
+        if (!domResponse.success) {
+            showError("Failed to get page DOM.")
+            resetUI()
+            return
+        }
 
-            if (!domResponse.success) {
-                showError("Failed to get page DOM.")
-                resetUI()
-                return
-            }
-
-            const dom = domResponse.dom
-
-            // Send to backend
-            updateStatus("Thinking...", "processing")
-            console.log("[v0] Sending to backend...")
-
-            const backendResponse = await new Promise((resolve) => {
-                chrome.runtime.sendMessage(
-                    {
-                        type: "SEND_TO_BACKEND",
-                        audio: base64Audio,
-                        dom: dom,
-                        tabId: currentTabId,
-                    },
-                    (response) => {
-                        resolve(response)
-                    },
-                )
-            })
-
-            if (!backendResponse.success) {
-                showError(`Backend error: ${backendResponse.error}`)
-                resetUI()
-                return
-            }
-
-            // Display results
-            updateStatus("Executing...", "processing")
-            displayResults(backendResponse)
-
-            // Play audio response
-            if (backendResponse.audioResponse) {
-                const audioData = Uint8Array.from(atob(backendResponse.audioResponse), (c) => c.charCodeAt(0))
-                const audioBlob = new Blob([audioData], { type: "audio/mp3" })
-                const audioUrl = URL.createObjectURL(audioBlob)
-                const audio = new Audio(audioUrl)
-                audio.play().catch((e) => console.error("[v0] Error playing audio:", e))
-            }
-
-            // Wait a bit then reset
-            setTimeout(() => {
-                updateStatus("Complete", "success")
-                setTimeout(() => {
-                    resetUI()
-                }, 2000)
-            }, 2000)
+        const dom = domResponse.dom
+
+        // Hand the recording to the background worker through IndexedDB so the
+        // command keeps running even if the popup closes
+        const audioKey = `recording-${Date.now()}`
+        await putAudio(audioKey, audioBlob)
+
+        // Send to backend
+        updateStatus("Thinking...", "processing")
+        console.log("[v0] Sending to backend...")
+
+        const backendResponse = await new Promise((resolve) => {
+            chrome.runtime.sendMessage(
+                {
+                    type: "SEND_TO_BACKEND",
+                    audioKey: audioKey,
+                    dom: dom,
+                    tabId: currentTabId,
+                },
+                (response) => {
+                    resolve(response)
+                },
+            )
+        })
+
+        if (!backendResponse.success) {
+            showError(`Backend error: ${backendResponse.error}`)
+            resetUI()
+            return
         }
 
-        reader.readAsDataURL(audioBlob)
+        // Display results
+        updateStatus("Executing...", "processing")
+        displayResults(backendResponse)
+
+        // Play audio response
+        playAudioResponse(backendResponse).catch((e) => console.error("[v0] Error playing audio:", e))
+
+        // Wait a bit then reset
+        setTimeout(() => {
+            updateStatus("Complete", "success")
+            setTimeout(() => {
+                resetUI()
+            }, 2000)
+        }, 2000)
     } catch (error) {
         console.error("[v0] Error handling recording stop:", error)
         showError(`Error: ${error.message}`)
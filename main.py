@@ -1,15 +1,16 @@
 from fastapi import FastAPI, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 import os
 from dotenv import load_dotenv
+import asyncio
 import base64
+import json
 import uuid
 from datetime import datetime
 
-from services.voice_service import VoiceService
-from services.storage_service import StorageService
-from services.brain_service import BrainService
+from services.registry import ServiceRegistry
 
 load_dotenv()
 
@@ -27,13 +28,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-voice_service = VoiceService()
-storage_service = StorageService()
-brain_service = BrainService()
+def _create_voice_service():
+    from services.voice_service import VoiceService
+    return VoiceService()
+
+def _create_storage_service():
+    from services.storage_service import StorageService
+    return StorageService()
+
+def _create_brain_service():
+    from services.brain_service import BrainService
+    return BrainService()
+
+# Provider services are imported and built on first use (or by prewarming)
+services = ServiceRegistry()
+services.register("voice", _create_voice_service)
+services.register("storage", _create_storage_service)
+services.register("brain", _create_brain_service)
+
+# Comma-separated services to warm at startup; empty disables prewarming
+PREWARM_SERVICES = [
+    name.strip()
+    for name in os.getenv("PREWARM_SERVICES", "voice,storage,brain").split(",")
+    if name.strip()
+]
+services.check_names(PREWARM_SERVICES)
+
+async def get_service(name: str):
+    """Return a service, building it in a worker thread so the event loop never waits on it."""
+    return await run_in_threadpool(services.get, name)
+
+RESPONSE_MODES = ("base64", "url", "binary")
+
+def build_multipart_response(result: dict, audio_bytes: bytes) -> Response:
+    """Return the JSON result and the raw audio as one multipart/form-data body."""
+    boundary = uuid.uuid4().hex
+    body = b"".join([
+        f"--{boundary}\r\n".encode(),
+        b'Content-Disposition: form-data; name="result"\r\n',
+        b"Content-Type: application/json\r\n\r\n",
+        json.dumps(result).encode("utf-8"),
+        f"\r\n--{boundary}\r\n".encode(),
+        b'Content-Disposition: form-data; name="audio"; filename="response.mp3"\r\n',
+        b"Content-Type: audio/mpeg\r\n\r\n",
+        audio_bytes,
+        f"\r\n--{boundary}--\r\n".encode(),
+    ])
+    return Response(content=body, media_type=f"multipart/form-data; boundary={boundary}")
 
 @app.on_event("startup")
 async def startup_event():
-    """Log startup."""
+    """Start prewarming provider connections and log startup."""
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(None, services.prewarm, PREWARM_SERVICES)
     print("Voice Samurai Backend started successfully")
 
 @app.get("/health")
@@ -41,10 +88,20 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "Voice Samurai Backend"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness endpoint: 503 until every prewarmed service is warm."""
+    if not services.prewarm_complete:
+        return JSONResponse(status_code=503, content={"status": "warming", "services": services.status()})
+    if not services.prewarm_ok:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "services": services.status()})
+    return {"status": "ready", "services": services.status()}
+
 @app.post("/api/v1/voice/command")
 async def process_voice_command(
         audio: UploadFile = File(...),
-        dom_context: str = Form(...)
+        dom_context: str = Form(...),
+        response_mode: str = Form("base64")
 ):
     """
     Process voice command and return action plan with audio response.
@@ -52,10 +109,28 @@ async def process_voice_command(
     Args:
         audio: Audio file uploaded by the client
         dom_context: JSON string containing page DOM structure
+        response_mode: How to return the speech response:
+            "base64" embeds it in the JSON body as audio_response_base64,
+            "url" uploads the audio to object storage and returns its
+            public URL as audio_response_url,
+            "binary" returns a multipart/form-data body with a "result"
+            JSON part and an "audio" part holding the raw bytes
 
     Returns:
-        JSON response with transcript, actions, and audio response
+        JSON response with transcript, actions, and audio response,
+        or a multipart body in "binary" mode
     """
+    if response_mode not in RESPONSE_MODES:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "error": f"Invalid response_mode: {response_mode}. Expected one of: {', '.join(RESPONSE_MODES)}",
+                "transcript": "",
+                "actions": [],
+                "audio_response_base64": ""
+            }
+        )
+
     try:
         audio_bytes = await audio.read()
 
@@ -64,7 +139,7 @@ async def process_voice_command(
         audio_filename = f"audio_logs/{timestamp}_{unique_id}.wav"
 
         try:
-            audio_url = storage_service.upload_file(
+            audio_url = (await get_service("storage")).upload_file(
                 audio_bytes,
                 audio_filename,
                 bucket=os.getenv("VULTR_BUCKET_NAME", "voice-samurai-logs")
@@ -75,7 +150,7 @@ async def process_voice_command(
             # Continue processing even if storage fails
 
         print(f"Transcribing audio...")
-        transcript = voice_service.transcribe_audio(audio_bytes)
+        transcript = (await get_service("voice")).transcribe_audio(audio_bytes)
 
         if not transcript or transcript.strip() == "":
             return JSONResponse(
@@ -91,23 +166,32 @@ async def process_voice_command(
         print(f"Transcript: {transcript}")
 
         print(f"Generating action plan...")
-        action_plan = brain_service.decide_action(transcript, dom_context)
+        action_plan = (await get_service("brain")).decide_action(transcript, dom_context)
 
         print(f"Generating speech response...")
         speak_text = action_plan.get("speak_before", "Command processed")
-        response_audio_bytes = voice_service.generate_speech(speak_text)
-
-        audio_response_base64 = base64.b64encode(response_audio_bytes).decode("utf-8")
+        response_audio_bytes = (await get_service("voice")).generate_speech(speak_text)
 
         response_data = {
             "transcript": transcript,
             "thought": action_plan.get("thought", ""),
             "speak_before": action_plan.get("speak_before", ""),
             "actions": action_plan.get("actions", []),
-            "audio_response_base64": audio_response_base64,
             "audio_log_url": audio_url if 'audio_url' in locals() else None
         }
 
+        if response_mode == "binary":
+            return build_multipart_response(response_data, response_audio_bytes)
+
+        if response_mode == "url":
+            response_data["audio_response_url"] = (await get_service("storage")).upload_file(
+                response_audio_bytes,
+                f"audio_responses/{timestamp}_{unique_id}.mp3",
+                bucket=os.getenv("VULTR_BUCKET_NAME", "voice-samurai-logs")
+            )
+        else:
+            response_data["audio_response_base64"] = base64.b64encode(response_audio_bytes).decode("utf-8")
+
         return JSONResponse(status_code=200, content=response_data)
 
     except Exception as e:
@@ -125,10 +209,11 @@ async def process_voice_command(
 @app.post("/api/v1/health/diagnostic")
 async def diagnostic():
     """Diagnostic endpoint to check service availability."""
+    service_status = services.status()
     diagnostics = {
-        "voice_service": "ready",
-        "storage_service": "ready",
-        "brain_service": "ready",
+        "voice_service": service_status["voice"],
+        "storage_service": service_status["storage"],
+        "brain_service": service_status["brain"],
         "elevenlabs_key": "configured" if os.getenv("ELEVENLABS_API_KEY") else "missing",
         "openai_key": "configured" if os.getenv("OPENAI_API_KEY") else "missing",
         "vultr_credentials": "configured" if os.getenv("VULTR_ACCESS_KEY") else "missing"